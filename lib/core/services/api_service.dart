@@ -1,3 +1,4 @@
+import 'dart:collection';
 import 'dart:convert';
 import 'package:http/http.dart' as http;
 import 'package:get/get.dart';
@@ -19,6 +20,10 @@ class ApiService extends GetxService {
   // 当前学生ID（模拟登录）
   final RxString currentStudentId = 'student_001'.obs;
 
+  // 各接口最近请求耗时（毫秒），用于性能排查
+  final Map<String, Queue<int>> _latencySamples = {};
+  static const int _maxLatencySamples = 200;
+
   // API请求头
   Map<String, String> get headers => {
         'Content-Type': 'application/json; charset=UTF-8',
@@ -51,9 +56,12 @@ class ApiService extends GetxService {
   /// 获取题库统计
   Future<QuestionBankStats?> getQuestionBankStats() async {
     try {
-      final response = await http.get(
-        Uri.parse('${serverUrl.value}/api/questions/stats'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/questions/stats',
+        () => http.get(
+          Uri.parse('${serverUrl.value}/api/questions/stats'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -70,9 +78,12 @@ class ApiService extends GetxService {
   /// 获取单个题目
   Future<Question?> getQuestion(String questionId) async {
     try {
-      final response = await http.get(
-        Uri.parse('${serverUrl.value}/api/questions/$questionId'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/questions/{questionId}',
+        () => http.get(
+          Uri.parse('${serverUrl.value}/api/questions/$questionId'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -89,10 +100,13 @@ class ApiService extends GetxService {
   /// 创建题目
   Future<Question?> createQuestion(Question question) async {
     try {
-      final response = await http.post(
-        Uri.parse('${serverUrl.value}/api/questions'),
-        headers: headers,
-        body: json.encode(question.toJson()),
+      final response = await _timed(
+        'POST /api/questions',
+        () => http.post(
+          Uri.parse('${serverUrl.value}/api/questions'),
+          headers: headers,
+          body: json.encode(question.toJson()),
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -112,10 +126,13 @@ class ApiService extends GetxService {
   Future<SubmitAnswerResponse?> submitAnswer(
       SubmitAnswerRequest request) async {
     try {
-      final response = await http.post(
-        Uri.parse('${serverUrl.value}/api/answers/submit'),
-        headers: headers,
-        body: json.encode(request.toJson()),
+      final response = await _timed(
+        'POST /api/answers/submit',
+        () => http.post(
+          Uri.parse('${serverUrl.value}/api/answers/submit'),
+          headers: headers,
+          body: json.encode(request.toJson()),
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -132,9 +149,12 @@ class ApiService extends GetxService {
   /// 获取学生作答记录
   Future<List<AnswerRecord>> getStudentAnswers(String studentId) async {
     try {
-      final response = await http.get(
-        Uri.parse('${serverUrl.value}/api/answers/student/$studentId'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/answers/student/{studentId}',
+        () => http.get(
+          Uri.parse('${serverUrl.value}/api/answers/student/$studentId'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -165,9 +185,12 @@ class ApiService extends GetxService {
   /// 获取学生能力画像
   Future<StudentProfile?> getStudentProfile(String studentId) async {
     try {
-      final response = await http.get(
-        Uri.parse('${serverUrl.value}/api/student/$studentId/profile'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/student/{studentId}/profile',
+        () => http.get(
+          Uri.parse('${serverUrl.value}/api/student/$studentId/profile'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -187,10 +210,13 @@ class ApiService extends GetxService {
   Future<RecommendationResponse?> getRecommendations(
       RecommendationRequest request) async {
     try {
-      final response = await http.post(
-        Uri.parse('${serverUrl.value}/api/student/recommend'),
-        headers: headers,
-        body: json.encode(request.toJson()),
+      final response = await _timed(
+        'POST /api/student/recommend',
+        () => http.post(
+          Uri.parse('${serverUrl.value}/api/student/recommend'),
+          headers: headers,
+          body: json.encode(request.toJson()),
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -209,9 +235,12 @@ class ApiService extends GetxService {
   /// 获取题目统计信息
   Future<QuestionStats?> getQuestionStats(String questionId) async {
     try {
-      final response = await http.get(
-        Uri.parse('${serverUrl.value}/api/admin/question/$questionId/stats'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/admin/question/{questionId}/stats',
+        () => http.get(
+          Uri.parse('${serverUrl.value}/api/admin/question/$questionId/stats'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -230,9 +259,12 @@ class ApiService extends GetxService {
   /// 获取所有讲解内容
   Future<TutorialsResponse?> getAllTutorials() async {
     try {
-      final response = await http.get(
-        Uri.parse('${serverUrl.value}/api/tutorials'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/tutorials',
+        () => http.get(
+          Uri.parse('${serverUrl.value}/api/tutorials'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -253,10 +285,13 @@ class ApiService extends GetxService {
       final encodedTheme = Uri.encodeComponent(themeName);
       final encodedChapter = Uri.encodeComponent(chapterName);
 
-      final response = await http.get(
-        Uri.parse(
-            '${serverUrl.value}/api/tutorials/chapter/$encodedTheme/$encodedChapter'),
-        headers: headers,
+      final response = await _timed(
+        'GET /api/tutorials/chapter/{theme}/{chapter}',
+        () => http.get(
+          Uri.parse(
+              '${serverUrl.value}/api/tutorials/chapter/$encodedTheme/$encodedChapter'),
+          headers: headers,
+        ),
       );
 
       if (response.statusCode == 200) {
@@ -275,10 +310,13 @@ class ApiService extends GetxService {
   /// 提交题目纠错反馈
   Future<void> submitFeedback(Map<String, dynamic> feedback) async {
     try {
-      final response = await http.post(
-        Uri.parse('${serverUrl.value}/api/feedback'),
-        headers: headers,
-        body: json.encode(feedback),
+      final response = await _timed(
+        'POST /api/feedback',
+        () => http.post(
+          Uri.parse('${serverUrl.value}/api/feedback'),
+          headers: headers,
+          body: json.encode(feedback),
+        ),
       );
 
       if (response.statusCode != 200) {
@@ -289,4 +327,41 @@ class ApiService extends GetxService {
       rethrow;
     }
   }
+
+  // ==================== 请求耗时统计 ====================
+
+  /// 执行请求并记录该接口的耗时（仅记录收到响应的请求，异常不计入）
+  Future<T> _timed<T>(String route, Future<T> Function() request) async {
+    final stopwatch = Stopwatch()..start();
+    final result = await request();
+    final samples = _latencySamples.putIfAbsent(route, () => Queue<int>());
+    samples.addLast(stopwatch.elapsedMilliseconds);
+    if (samples.length > _maxLatencySamples) {
+      samples.removeFirst();
+    }
+    return result;
+  }
+
+  /// 获取各接口耗时统计（次数、p50、p95、p99，单位毫秒）
+  Map<String, Map<String, int>> getLatencyStats() {
+    int percentile(List<int> sorted, double p) {
+      final index = ((sorted.length - 1) * p).round();
+      return sorted[index];
+    }
+
+    return _latencySamples.map((route, samples) {
+      final sorted = List<int>.from(samples)..sort();
+      return MapEntry(route, {
+        'count': sorted.length,
+        'p50': percentile(sorted, 0.50),
+        'p95': percentile(sorted, 0.95),
+        'p99': percentile(sorted, 0.99),
+      });
+    });
+  }
+
+  /// 清空耗时统计
+  void resetLatencyStats() {
+    _latencySamples.clear();
+  }
 }
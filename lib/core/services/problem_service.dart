@@ -1,4 +1,5 @@
 import 'dart:convert';
+import 'package:flutter/foundation.dart';
 import 'package:flutter/services.dart';
 import 'package:get/get.dart';
 import '../models/question.dart';
@@ -19,8 +20,8 @@ class ProblemService extends GetxService {
       isLoading.value = true;
       final String jsonString =
           await rootBundle.loadString('assets/data/problems.json');
-      final List<dynamic> jsonData = json.decode(jsonString);
-      _allProblems = jsonData.map((json) => Question.fromJson(json)).toList();
+      // 在后台 isolate 中解析，避免启动时阻塞 UI 线程
+      _allProblems = await compute(_parseProblems, jsonString);
     } catch (e) {
       print('Error loading problems: $e');
       _allProblems = [];
@@ -64,3 +65,9 @@ class ProblemService extends GetxService {
     }
   }
 }
+
+/// 解析题目 JSON（需为顶层函数以便在 isolate 中运行）
+List<Question> _parseProblems(String jsonString) {
+  final List<dynamic> jsonData = json.decode(jsonString);
+  return jsonData.map((json) => Question.fromJson(json)).toList();
+}
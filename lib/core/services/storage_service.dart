@@ -118,4 +118,21 @@ class StorageService extends GetxService {
   String? getCachedConfigTime() {
     return _prefs.getString('cached_config_time');
   }
+
+  // ==================== 画像缓存 ====================
+
+  /// 保存学生画像缓存（只保留当前学生的一份）
+  Future<bool> setCachedProfile(String profileJson) {
+    return _prefs.setString('cached_student_profile', profileJson);
+  }
+
+  /// 获取学生画像缓存
+  String? getCachedProfile() {
+    return _prefs.getString('cached_student_profile');
+  }
+
+  /// 清除学生画像缓存
+  Future<bool> clearCachedProfile() {
+    return _prefs.remove('cached_student_profile');
+  }
 }
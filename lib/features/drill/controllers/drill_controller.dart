@@ -1,3 +1,4 @@
+import 'dart:async';
 import 'package:get/get.dart';
 import '../../../core/models/question.dart';
 import '../../../core/models/answer_record.dart';
@@ -298,6 +299,7 @@ class DrillController extends GetxController {
       }
 
       // 如果不是离线模式，提交到后端
+      // 本地已完成判题，不等待后端判题结果，避免后端判题耗时阻塞答题流程
       if (!isOfflineMode) {
         final studentId = _storageService.getStudentId() ??
             _apiService.currentStudentId.value;
@@ -309,13 +311,13 @@ class DrillController extends GetxController {
           timeSpentSeconds: timeSpent,
         );
 
-        final response = await _apiService.submitAnswer(request);
-
-        if (response != null) {
-          print('Answer submitted successfully');
-        } else {
-          print('Failed to submit answer to server');
-        }
+        unawaited(_apiService.submitAnswer(request).then((response) {
+          if (response != null) {
+            print('Answer submitted successfully');
+          } else {
+            print('Failed to submit answer to server');
+          }
+        }));
       }
 
       // 如果答对，自动下一题；如果答错，显示解析
@@ -1,3 +1,4 @@
+import 'dart:convert';
 import 'package:get/get.dart';
 import '../../../core/models/student_profile.dart';
 import '../../../core/models/answer_record.dart';
@@ -12,6 +13,9 @@ class ProfileController extends GetxController {
   // 学生画像
   final Rx<StudentProfile?> profile = Rx<StudentProfile?>(null);
 
+  // 当前画像是否为未经服务器确认的缓存数据
+  final RxBool isProfileStale = false.obs;
+
   // 作答记录
   final RxList<AnswerRecord> answerRecords = <AnswerRecord>[].obs;
 
@@ -25,6 +29,8 @@ class ProfileController extends GetxController {
   @override
   void onInit() {
     super.onInit();
+    // 先展示本地缓存的画像，再从服务器刷新
+    _loadCachedProfile();
     _initLoad();
   }
 
@@ -60,16 +66,49 @@ class ProfileController extends GetxController {
 
       if (result != null) {
         profile.value = result;
+        isProfileStale.value = false;
+        _storageService.setCachedProfile(json.encode(result.toJson()));
         print('✅ 学生画像加载成功');
       } else {
         print('ℹ️ 暂无学习画像数据');
+        _markProfileStale();
       }
     } catch (e) {
       print('⚠️ 加载学生画像失败: $e');
+      _markProfileStale();
       // 不抛出异常，让应用继续运行
     }
   }
 
+  /// 服务器未返回画像时：丢弃其他学生的旧画像，当前学生的画像标记为过期
+  void _markProfileStale() {
+    if (profile.value != null && profile.value!.studentId != studentId) {
+      profile.value = null;
+      _storageService.clearCachedProfile();
+    }
+    isProfileStale.value = profile.value != null;
+  }
+
+  /// 从本地缓存恢复学生画像（仅当缓存属于当前学生时）
+  void _loadCachedProfile() {
+    final cached = _storageService.getCachedProfile();
+    if (cached == null) return;
+
+    try {
+      final cachedProfile = StudentProfile.fromJson(
+          json.decode(cached) as Map<String, dynamic>);
+      if (cachedProfile.studentId == studentId) {
+        profile.value = cachedProfile;
+        isProfileStale.value = true;
+      } else {
+        _storageService.clearCachedProfile();
+      }
+    } catch (e) {
+      print('⚠️ 画像缓存解析失败: $e');
+      _storageService.clearCachedProfile();
+    }
+  }
+
   /// 加载作答记录
   Future<void> loadAnswerRecords() async {
     try {
@@ -19,7 +19,8 @@ class ProfilePage extends GetView<ProfileController> {
         ],
       ),
       body: Obx(() {
-        if (controller.isLoading.value) {
+        // 有缓存画像时直接展示，仅在无数据时显示加载动画
+        if (controller.isLoading.value && controller.profile.value == null) {
           return const Center(child: CircularProgressIndicator());
         }
 
@@ -55,6 +56,15 @@ class ProfilePage extends GetView<ProfileController> {
           child: ListView(
             padding: const EdgeInsets.all(16),
             children: [
+              // 缓存数据提示
+              if (controller.isProfileStale.value)
+                const Padding(
+                  padding: EdgeInsets.only(bottom: 12),
+                  child: Text(
+                    '当前显示的是本地缓存数据，可能不是最新',
+                    style: TextStyle(color: Colors.grey),
+                  ),
+                ),
               // 预测分数卡片
               _buildPredictedScoreCard(profile.predictedScore),
               const SizedBox(height: 16),
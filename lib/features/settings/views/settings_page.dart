@@ -108,6 +108,14 @@ class SettingsPage extends StatelessWidget {
               );
             },
           ),
+          ListTile(
+            leading: const Icon(Icons.speed),
+            title: const Text('接口耗时'),
+            subtitle: const Text('查看最近请求的 p50/p95/p99 耗时'),
+            onTap: () {
+              _showLatencyStatsDialog(apiService);
+            },
+          ),
           SwitchListTile(
             secondary: const Icon(Icons.offline_bolt),
             title: const Text('离线模式'),
@@ -252,4 +260,47 @@ class SettingsPage extends StatelessWidget {
       },
     );
   }
+
+  /// 显示各接口耗时统计对话框
+  void _showLatencyStatsDialog(ApiService apiService) {
+    final stats = apiService.getLatencyStats();
+    final routes = stats.keys.toList()..sort();
+
+    Get.defaultDialog(
+      title: '接口耗时（毫秒）',
+      content: Padding(
+        padding: const EdgeInsets.symmetric(horizontal: 16),
+        child: routes.isEmpty
+            ? const Text('暂无请求记录')
+            : ConstrainedBox(
+                constraints: BoxConstraints(maxHeight: Get.height * 0.5),
+                child: SingleChildScrollView(
+                  child: Column(
+                    crossAxisAlignment: CrossAxisAlignment.start,
+                    children: routes.map((route) {
+                      final routeStats = stats[route]!;
+                      return Padding(
+                        padding: const EdgeInsets.symmetric(vertical: 4),
+                        child: Text(
+                          '$route\n'
+                          '次数 ${routeStats['count']} · '
+                          'p50 ${routeStats['p50']} · '
+                          'p95 ${routeStats['p95']} · '
+                          'p99 ${routeStats['p99']}',
+                          style: const TextStyle(fontSize: 12),
+                        ),
+                      );
+                    }).toList(),
+                  ),
+                ),
+              ),
+      ),
+      textConfirm: '清空',
+      textCancel: '关闭',
+      onConfirm: () {
+        apiService.resetLatencyStats();
+        Navigator.of(Get.overlayContext!).pop();
+      },
+    );
+  }
 }